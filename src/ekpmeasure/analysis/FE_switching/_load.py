@@ -1,6 +1,54 @@
 import numpy as np
+import pandas as pd
 
-__all__ = ("common_name_mapper",)
+__all__ = (
+    "common_name_mapper",
+    "common_name_mapper_vec",
+)
+
+
+def _build_area_diameter_dict():
+    """Map identifier prefix (e.g. '5um') to (area, diameter)."""
+    area_diameter_dict = {
+        "{}um".format(np.round(5 + d * 4.5, 1))
+        .replace("0", "")
+        .replace(".", ""): (
+            np.pi * ((np.round(5 + d * 4.5, 1)) / 2) ** 2,
+            np.round(5 + d * 4.5, 1),
+        )
+        for d in range(9)
+    }
+
+    area_diameter_dict.update(
+        {
+            "125um": (np.pi * (12.5 / 2) ** 2, 12.5),
+            "25um": (np.pi * (25 / 2) ** 2, 25),
+            "50um": (np.pi * (50 / 2) ** 2, 50),
+        }
+    )
+
+    area_diameter_dict.update(
+        {
+            "8um": (np.pi * (8 / 2) ** 2, 8),
+            "4um": (np.pi * (4 / 2) ** 2, 4),
+            "6um": (np.pi * (6 / 2) ** 2, 6),
+        }
+    )
+
+    return area_diameter_dict
+
+
+_AREA_DIAMETER_DICT = _build_area_diameter_dict()
+
+
+def _parse_V_x(field):
+    """Parse a voltage field like '0x5V' -> 0.5."""
+    return float(field.replace("V", "").replace("x", "."))
+
+
+def _parse_mv(field):
+    """Parse a millivolt field like '500mv' -> 0.5."""
+    return float(field.replace("mv", "")) / 1000
 
 
 def common_name_mapper(fname):
@@ -32,33 +80,7 @@ def common_name_mapper(fname):
     string = fname.replace(".csv", "")
     spl = string.split("_")
 
-    area_diameter_dict = {
-        "{}um".format(np.round(5 + d * 4.5, 1))
-        .replace("0", "")
-        .replace(".", ""): (
-            np.pi * ((np.round(5 + d * 4.5, 1)) / 2) ** 2,
-            np.round(5 + d * 4.5, 1),
-        )
-        for d in range(9)
-    }
-
-    area_diameter_dict.update(
-        {
-            "125um": (np.pi * (12.5 / 2) ** 2, 12.5),
-            "25um": (np.pi * (25 / 2) ** 2, 25),
-            "50um": (np.pi * (50 / 2) ** 2, 50),
-        }
-    )
-
-    area_diameter_dict.update(
-        {
-            "8um": (np.pi * (8 / 2) ** 2, 8),
-            "4um": (np.pi * (4 / 2) ** 2, 4),
-            "6um": (np.pi * (6 / 2) ** 2, 6),
-        }
-    )
-
-    area, diameter = area_diameter_dict[spl[0].split("um")[0] + "um"]
+    area, diameter = _AREA_DIAMETER_DICT[spl[0].split("um")[0] + "um"]
 
     out = dict(
         {
@@ -67,11 +89,68 @@ def common_name_mapper(fname):
             "diameter": diameter,
             "pulsewidth_ns": float(spl[1]) * 1e9,
             "delay_ns": float(spl[2]) * 1e9,
-            "high_voltage_v": float(spl[3].replace("V", "").replace("x", ".")),
-            "preset_voltage_v": float(spl[4].replace("mv", "")) / 1000,
+            "high_voltage_v": _parse_V_x(spl[3]),
+            "preset_voltage_v": _parse_mv(spl[4]),
             "preset_pulsewidth_ns": float(spl[5].replace("ns", "")),
             "filename": fname,
             "trial": int(spl[6]),
         }
     )
     return out
+
+
+def common_name_mapper_vec(fnames):
+    """Vectorized form of :func:`common_name_mapper`. Parses all filenames in a single pandas pass rather than once per file, which is much faster for directories holding many files.
+
+    args:
+            fnames (array-like of str): Filenames
+
+    returns:
+            (pandas.DataFrame): One row per parseable filename, with the same columns as ``common_name_mapper``. Filenames that do not parse are reported and skipped.
+    """
+    s = pd.Series(fnames, dtype="object")
+    spl = s.str.replace(".csv", "", regex=False).str.split("_", expand=True)
+
+    if spl.shape[1] < 7:
+        for file in s:
+            print("unable to process file: {}".format(file))
+        return pd.DataFrame()
+
+    area_diameter = (spl[0].str.split("um").str[0] + "um").map(_AREA_DIAMETER_DICT)
+
+    out = pd.DataFrame(
+        {
+            "identifier": spl[0],
+            "area": area_diameter.str[0],
+            "diameter": area_diameter.str[1],
+            "pulsewidth_ns": pd.to_numeric(spl[1], errors="coerce") * 1e9,
+            "delay_ns": pd.to_numeric(spl[2], errors="coerce") * 1e9,
+            "high_voltage_v": pd.to_numeric(
+                spl[3]
+                .str.replace("V", "", regex=False)
+                .str.replace("x", ".", regex=False),
+                errors="coerce",
+            ),
+            "preset_voltage_v": pd.to_numeric(
+                spl[4].str.replace("mv", "", regex=False), errors="coerce"
+            )
+            / 1000,
+            "preset_pulsewidth_ns": pd.to_numeric(
+                spl[5].str.replace("ns", "", regex=False), errors="coerce"
+            ),
+            "filename": s,
+            "trial": pd.to_numeric(spl[6], errors="coerce"),
+        }
+    )
+
+    bad = out.drop(columns=["identifier", "filename"]).isna().any(axis=1)
+    for file in s[bad]:
+        print("unable to process file: {}".format(file))
+
+    out = out[~bad].reset_index(drop=True)
+    out["trial"] = out["trial"].astype(int)
+    return out
+
+
+# allows generate_meta_data to parse a whole directory listing in one call
+common_name_mapper.vectorized = common_name_mapper_vec
@@ -2,10 +2,15 @@ import os
 import pandas as pd
 import numpy as np
 
+import threading
 import warnings
 
+from collections import OrderedDict
+
 import matplotlib.pyplot as plt
 from matplotlib import cm
+from matplotlib.collections import LineCollection
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from numpy import AxisError
 import pickle
@@ -17,6 +22,97 @@ __all__ = (
     "Data",
 )
 
+try:
+    import pyarrow  # noqa: F401
+
+    # pandas grew engine='pyarrow' in 1.4; setup.cfg allows pandas>=1.3.2
+    _HAS_PYARROW = tuple(
+        int(part) for part in pd.__version__.split(".")[:2]
+    ) >= (1, 4)
+except ImportError:
+    _HAS_PYARROW = False
+
+
+def _default_readfileby(file):
+    """Default data reader. Uses pandas' pyarrow csv engine when pyarrow is installed (typically several times faster than the default engine for the homogeneous csvs read here), falling back to the default engine otherwise."""
+    if _HAS_PYARROW:
+        return pd.read_csv(file, engine="pyarrow")
+    return pd.read_csv(file)
+
+
+def _polars_readfileby(file):
+    """Read a csv with polars (whose parser is multi-threaded within a single file) and convert to ``pandas.DataFrame``. Requires polars. See ``Dataset.use_polars``."""
+    import polars
+
+    return polars.read_csv(file).to_pandas()
+
+
+class _CachedReader:
+    """Bounded LRU wrapper around a readfileby function.
+
+    Results are keyed on ``(file, st_mtime_ns, st_size)`` so edited files are
+    re-read; repeated get_data calls over overlapping groups then skip
+    re-parsing unchanged files. Cache hits return a copy so callers never
+    share buffers. Thread safe (get_data reads on a thread pool); the cache
+    itself is not pickled with the reader.
+
+    args:
+            readfileby (function): The reader to wrap.
+            maxsize (int): Maximum number of cached files.
+
+    """
+
+    def __init__(self, readfileby, maxsize=256):
+        self.readfileby = readfileby
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def __name__(self):
+        # surfaced in get_data error messages
+        return getattr(self.readfileby, "__name__", repr(self.readfileby))
+
+    def __call__(self, file):
+        st = os.stat(file)
+        key = (file, st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+
+        if cached is not None:
+            return cached.copy()
+
+        result = self.readfileby(file)
+
+        with self._lock:
+            self._cache[key] = result
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+        return result.copy()
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    # merge/concat utils compare readfileby across Datasets
+    def __eq__(self, other):
+        if isinstance(other, _CachedReader):
+            return self.readfileby == other.readfileby
+        return self.readfileby == other
+
+    def __hash__(self):
+        return hash(self.readfileby)
+
+    def __getstate__(self):
+        return {"readfileby": self.readfileby, "maxsize": self.maxsize}
+
+    def __setstate__(self, state):
+        self.__init__(state["readfileby"], state["maxsize"])
+
 
 def construct_Dataset_from_dataframe(function):
     @wraps(function)
@@ -56,11 +152,18 @@ def _convert_ITP_to_path_to_index(index_to_path):
     return {
         x: y.values
         for x, y in pd.Series(index_to_path.index, index=index_to_path.values).groupby(
-            level=0
+            level=0, sort=False
         )
     }
 
 
+def _as_iterable(value):
+    """Coerce a scalar-or-sequence argument to a tuple. Avoids building a throwaway object-dtype numpy array just to normalize arguments."""
+    if isinstance(value, (list, tuple, set, np.ndarray, pd.Index, pd.Series)):
+        return tuple(value)
+    return (value,)
+
+
 def _check_file_exists(path, filename):
     if filename in set(os.listdir(path)):
         return True
@@ -92,7 +195,7 @@ class Dataset:
     Args:
             path (str or dict): Path to the real data.
             initializer (pandas.DataFrame or dict):  Initializer for a DataFrame. The meta data.
-            readfileby (function): How to read the data. Default is ``pandas.read_csv``
+            readfileby (function): How to read the data. Default is ``pandas.read_csv`` (with the faster pyarrow engine when pyarrow is installed).
             pointercolumn (str or index): Column name which holds name of file. Default is ``'filename'``
 
     Examples:
@@ -118,15 +221,39 @@ class Dataset:
 
     """
 
+    # dtype used for stacked float columns returned by get_data. float32
+    # halves memory and roughly doubles reduction throughput, which is plenty
+    # of precision for trace data being averaged and plotted. set
+    # Dataset.dtype_hint = np.float64 for full precision or None to keep
+    # whatever dtype the reader produced. non-float columns are never cast
+    dtype_hint = np.float32
+
+    # bound on the number of files memoized by the readfileby cache. see
+    # _CachedReader and clear_cache()
+    cache_size = 256
+
+    # when True, only the first file of each group in get_data is parsed with
+    # readfileby (to learn the columns); the rest are read with np.loadtxt,
+    # skipping per-file DataFrame parsing. only valid for all-numeric csvs
+    # sharing the first file's schema
+    fast_numeric_mode = False
+
     def __init__(
-        self, path, initializer, readfileby=pd.read_csv, pointercolumn="filename"
+        self,
+        path,
+        initializer,
+        readfileby=_default_readfileby,
+        pointercolumn="filename",
     ):
         self.meta_data = pd.DataFrame(initializer)
         self.attrs = dict()
         self.attrs["path"] = path
         self.attrs["index_to_path"] = self._construct_index_to_path(path, initializer)
         self.pointercolumn = pointercolumn
-        self.readfileby = readfileby
+        if isinstance(readfileby, _CachedReader):
+            self.readfileby = readfileby  # share the cache, don't rewrap
+        else:
+            self.readfileby = _CachedReader(readfileby, maxsize=self.cache_size)
 
     def __str__(self):
         return self.meta_data.__str__()
@@ -145,11 +272,38 @@ class Dataset:
         return self.meta_data.columns
 
     @property
-    def _is_empty(self):
-        if len(self) == 0 and len(self.columns) == 0:
-            return True
+    def use_polars(self):
+        """Whether data is read with polars' multi-threaded csv reader instead of pandas. Opt in with ``dset.use_polars = True`` (requires polars; data is converted to ``pandas.DataFrame`` after reading so downstream behavior is unchanged)."""
+        readfileby = self.readfileby
+        if isinstance(readfileby, _CachedReader):
+            readfileby = readfileby.readfileby
+        return readfileby is _polars_readfileby
+
+    @use_polars.setter
+    def use_polars(self, value):
+        if value:
+            try:
+                import polars  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "polars is not installed. install it to use use_polars=True."
+                )
+            self.readfileby = _CachedReader(
+                _polars_readfileby, maxsize=self.cache_size
+            )
         else:
-            return False
+            self.readfileby = _CachedReader(
+                _default_readfileby, maxsize=self.cache_size
+            )
+
+    def clear_cache(self):
+        """Clear files memoized by ``readfileby``. Cached entries are invalidated automatically when a file's mtime or size changes; this just frees the memory."""
+        if isinstance(self.readfileby, _CachedReader):
+            self.readfileby.clear()
+
+    @property
+    def _is_empty(self):
+        return len(self) == 0 and len(self.columns) == 0
 
     @property
     def path(self):
@@ -210,8 +364,10 @@ class Dataset:
         for column in self.columns:
             if column == self.pointercolumn:
                 continue
+            # pd.unique deduplicates in C; only the (few) unique values are
+            # then touched in Python for nan handling
             summary.update(
-                {column: _remove_nans_from_set(set(self.meta_data[column].values))}
+                {column: _remove_nans_from_set(pd.unique(self.meta_data[column].values))}
             )
 
         return summary
@@ -292,15 +448,17 @@ class Dataset:
         return pd.DataFrame(self.meta_data.iloc[index]).T.reset_index(drop=True)
 
     def _write_ekpds_file(self, filename):
-        preamble = "pointercolumn:{}|path:{}".format(
-            self.pointercolumn, {key: list(self.path[key]) for key in self.path}
-        )
+        # a single stream of three pickles. older versions wrote a pickled
+        # preamble string and byte separators which the reader had to scan
+        # for; load.read_ekpds still reads those legacy files
+        header = {
+            "pointercolumn": self.pointercolumn,
+            "path": {key: list(self.path[key]) for key in self.path},
+        }
         with open(filename, "wb+") as f:
-            f.write(pickle.dumps(preamble))
-            f.write(b"########")
-            f.write(pickle.dumps(self.readfileby))
-            f.write(b"##|##|##|##")
-            f.write(pickle.dumps(self.meta_data))
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(self.readfileby, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(self.meta_data, f, protocol=pickle.HIGHEST_PROTOCOL)
 
         return
 
@@ -348,7 +506,7 @@ class Dataset:
                 (Dataset): updated Dataset
 
         """
-        index = np.array([index]).flatten()
+        index = list(_as_iterable(index))
 
         # adjust index_to_path and convert to path_to_index
         path = _convert_ITP_to_path_to_index(
@@ -385,44 +543,54 @@ class Dataset:
     def _group(self, by, level=None):
         """Group data by 'by' and return a pandas dataframe. makes use of pandas.groupby
 
+        Each non-pointer column of the result holds the set of values for that
+        group; the pointer column holds a dict mapping original index to
+        filename. Aggregation is done with a single ``groupby.agg`` call
+        rather than per-row Python loops.
+
         args:
                 by (str, int, label or array-like of): on what to group.
         """
-        groups = self.meta_data.groupby(by=by, level=level).groups
-        for ijk, key in enumerate(groups):
-            original_dataset_indices = groups[key]
-            new_row = None
-            for index in original_dataset_indices:
-                original_row = self.meta_data.loc[
-                    index
-                ]  # this is a pandas series of a row from the original dataset
-                # columns in this row
-                if type(new_row) == type(None):
-                    # import pdb; pdb.set_trace()
-                    new_row = {
-                        col: dict({index: original_row[col]})
-                        for col in original_row.index
-                    }
-                else:
-                    for col in new_row:
-                        # import pdb; pdb.set_trace()
-                        new_row[col].update(dict({index: original_row[col]}))
-
-            for col in new_row:
-                if col != self.pointercolumn:
-                    new_row[col] = set(
-                        list([new_row[col][x] for x in new_row[col].keys()])
-                    )
+        if by is None:
+            key_labels = []
+        elif isinstance(by, str) or not hasattr(by, "__iter__"):
+            key_labels = [by]  # a single label, possibly non-str
+        else:
+            key_labels = list(by)
+
+        # only entries naming actual metadata columns are consumed as group
+        # keys by pandas and need their scalars wrapped back into sets below.
+        # an array-like of per-row group values grabs no columns; its key ends
+        # up in the index and is dropped by the final column selection
+        key_columns = [col for col in key_labels if col in set(self.meta_data.columns)]
+
+        agg_funcs = {
+            col: (lambda s: dict(zip(s.index, s)))
+            if col == self.pointercolumn
+            else (lambda s: set(s))
+            for col in self.meta_data.columns
+            if col not in set(key_columns)
+        }
+
+        new_df = (
+            # sort=False since callers iterate the groups rather than relying
+            # on key order; observed=True keeps categorical keys from
+            # expanding to unused categories; dropna=False keeps groups whose
+            # key contains nan (routine in metadata here), which agg would
+            # otherwise silently drop
+            self.meta_data.groupby(
+                by=by, level=level, sort=False, observed=True, dropna=False
+            )
+            .agg(agg_funcs)
+            .reset_index(drop=(by is None))
+        )
 
-            if ijk == 0:
-                new_df = pd.DataFrame({key: [new_row[key]] for key in new_row})
-            else:
-                new_df = pd.concat(
-                    (new_df, pd.DataFrame({key: [new_row[key]] for key in new_row})),
-                    ignore_index=True,
-                )
+        # the group keys come back as scalars; wrap them in sets to match the
+        # other columns
+        for col in key_columns:
+            new_df[col] = [{value} for value in new_df[col]]
 
-        return new_df
+        return new_df[list(self.meta_data.columns)]
 
     def add_calculated_column(self, column_name, how):
         """Add a calculated column to the Dataset.
@@ -467,7 +635,11 @@ class Dataset:
             )
 
         path = list(set(self.index_to_path))[0]
-        self.meta_data.to_pickle(path + "meta_data")
+        self.meta_data.to_pickle(path + "meta_data", protocol=pickle.HIGHEST_PROTOCOL)
+
+        from .load import _META_CACHE  # local import to avoid circularity
+
+        _META_CACHE.pop(path, None)
 
         return
 
@@ -644,101 +816,73 @@ class Dataset:
         else:
             data_to_retrieve = self._group(by=groupby)
 
+        # pull the grouped rows out of pandas once; per-cell .at lookups
+        # dispatch through the label indexer on every access
+        group_rows = data_to_retrieve.to_dict("records")
+        index_to_path = self.index_to_path.to_dict()
+
         out = {}
-        for counter, i in enumerate(data_to_retrieve.index):  # for each row
-            # NOTE data_to_retrieve.at[i, self.pointercolumn] is a dict
-            filename_index_to_path_dict = data_to_retrieve.at[i, self.pointercolumn]
-            for k, index_of_original in enumerate(filename_index_to_path_dict):
-                try:
-                    tdf = readfileby(
-                        self.index_to_path[index_of_original]
-                        + filename_index_to_path_dict[index_of_original]
-                    )
-                except Exception as e:
-                    raise Exception(
-                        "error reading data. ensure self.readfileby is correct and that readfileby returns a pandas dataframe. self.readfileby is currently set to {}.\nError was: {}".format(
-                            self.readfileby.__name__, e
+        first_columns = None  # column Index of the first file read
+        for counter, row in enumerate(group_rows):  # for each row
+            # NOTE row[self.pointercolumn] is a dict
+            filename_index_to_path_dict = row[self.pointercolumn]
+            full_paths = [
+                index_to_path[index_of_original]
+                + filename_index_to_path_dict[index_of_original]
+                for index_of_original in filename_index_to_path_dict
+            ]
+
+            # read the group's files on a thread pool. reading is IO bound and
+            # the csv parser releases the GIL, so threads overlap well
+            try:
+                if len(full_paths) == 1:
+                    tdfs = [readfileby(full_paths[0])]
+                elif self.fast_numeric_mode:
+                    # parse the first file normally to learn the schema, then
+                    # read the rest with the bare numpy text reader
+                    first = readfileby(full_paths[0])
+                    loadtxt_readfileby = _make_loadtxt_readfileby(first.columns)
+                    with ThreadPoolExecutor(
+                        max_workers=min(32, len(full_paths))
+                    ) as ex:
+                        tdfs = [first] + list(
+                            ex.map(loadtxt_readfileby, full_paths[1:])
                         )
+                else:
+                    with ThreadPoolExecutor(
+                        max_workers=min(32, len(full_paths))
+                    ) as ex:
+                        tdfs = list(ex.map(readfileby, full_paths))
+            except Exception as e:
+                raise Exception(
+                    "error reading data. ensure self.readfileby is correct and that readfileby returns a pandas dataframe. self.readfileby is currently set to {}.\nError was: {}".format(
+                        self.readfileby.__name__, e
                     )
+                )
 
-                if i == 0:
-                    columns_set = set(tdf.columns)
+            if first_columns is None:
+                first_columns = tdfs[0].columns
 
-                if set(tdf.columns) != columns_set:
+            for tdf in tdfs:
+                # Index.equals is a single C-level comparison; no need to
+                # build a hash set per file
+                if not tdf.columns.equals(first_columns):
                     raise ValueError(
                         "not all data in this Dataset has the same columns!"
                     )
 
-                if k == 0:  # build the internal data out
-                    internal_out = {
-                        "definition": {
-                            col: data_to_retrieve.at[i, col] for col in self.columns
-                        },
-                        "data": {col: tdf[col].values for col in tdf.columns},
-                    }
-
-                else:
-                    try:  # catch ValueError if the concatenation fails for having different lengths. Allows us to merge data of different lengths
-                        for col in columns_set:
-                            internal_out["data"].update(
-                                {
-                                    col: np.vstack(
-                                        (internal_out["data"][col], tdf[col].values)
-                                    )
-                                }
-                            )
-                    except ValueError as e:
-                        if (
-                            "all the input array dimensions for the concatenation axis must match exactly"
-                            in str(e)
-                        ):
-                            for col in columns_set:
-                                current_stack = internal_out["data"][col]
-                                if len(current_stack.shape) != 2:
-                                    if len(current_stack.shape) == 1:
-                                        current_stack = np.reshape(
-                                            current_stack, (1, len(current_stack))
-                                        )
-                                    else:
-                                        raise ValueError(
-                                            "Current vstack is not 2 dimensional, meaning each row contains at least 2D data. Merging non-matching shapes is not allowed at higher dimensionality."
-                                        )
-                                current_nrows = current_stack.shape[0]
-                                current_len = current_stack.shape[1]
-                                new_len = max((current_len, len(tdf[col].values)))
-                                for index in range(current_nrows):
-                                    row = current_stack[index, :]
-                                    n_nans_to_add = new_len - len(row)
-                                    row = np.concatenate(
-                                        (
-                                            row,
-                                            np.array(
-                                                [np.nan for i in range(n_nans_to_add)]
-                                            ),
-                                        )
-                                    )
-                                    if index == 0:
-                                        new_stack = row
-                                    else:
-                                        new_stack = np.vstack((new_stack, row))
-
-                                new_data = tdf[col].values
-                                to_stack_on_end = np.concatenate(
-                                    (
-                                        new_data,
-                                        np.array(
-                                            [
-                                                np.nan
-                                                for i in range(new_len - len(new_data))
-                                            ]
-                                        ),
-                                    )
-                                )
-                                internal_out["data"].update(
-                                    {col: np.vstack((new_stack, to_stack_on_end))}
-                                )
-                        else:
-                            raise (e)
+            # stack each column once at the end rather than vstacking per
+            # file, which copies the entire growing stack on every iteration
+            internal_out = {
+                "definition": {col: row[col] for col in self.columns},
+                "data": {
+                    col: _stack_data_arrays(
+                        [tdf[col].values for tdf in tdfs],
+                        dtype_hint=self.dtype_hint,
+                    )
+                    for col in first_columns
+                },
+            }
 
             out.update({counter: internal_out})
 
@@ -752,7 +896,7 @@ class Dataset:
         if type(labelby) == type(None):
             return Data(out)
 
-        labelby = set(np.array([labelby]).flatten())
+        labelby = set(_as_iterable(labelby))
 
         for counter in out:
             # pop off the labels we don't want
@@ -766,6 +910,62 @@ class Dataset:
         return Data(out)
 
 
+def _make_loadtxt_readfileby(columns):
+    """Return a reader which loads an all-numeric csv with ``np.loadtxt`` and wraps it in a ``pandas.DataFrame`` with the given columns (taken from the first file of a group). Used by ``Dataset.fast_numeric_mode``."""
+
+    def loadtxt_readfileby(file):
+        arr = np.loadtxt(file, delimiter=",", skiprows=1, dtype=np.float64, ndmin=2)
+        return pd.DataFrame(arr, columns=columns)
+
+    return loadtxt_readfileby
+
+
+def _stack_data_arrays(arrs, dtype_hint=None):
+    """Stack per-file 1D arrays into a single 2D array.
+
+    A single array is returned as-is (1D). Arrays of differing lengths are
+    padded with nan to the longest length before stacking, which allows
+    merging data of different lengths.
+
+    args:
+            arrs (list of numpy.ndarray): 1D arrays, one per file
+            dtype_hint (numpy.dtype): Optional dtype for the stack when all arrays are floating point (see ``Dataset.dtype_hint``). Non-float data is never cast.
+
+    returns:
+            (numpy.ndarray): the stacked data
+
+    """
+    if len(arrs) == 1:
+        return arrs[0]
+
+    if dtype_hint is not None and not all(arr.dtype.kind == "f" for arr in arrs):
+        dtype_hint = None
+
+    lengths = set(len(arr) for arr in arrs)
+    if len(lengths) == 1:
+        if dtype_hint is not None:
+            # preallocate at the target dtype and cast row by row rather than
+            # stacking at float64 and converting the whole block afterwards
+            stacked = np.empty((len(arrs), lengths.pop()), dtype=dtype_hint)
+            for l, arr in enumerate(arrs):
+                stacked[l, :] = arr
+            return stacked
+        # keep the stack C-contiguous so downstream axis-0 reductions
+        # (Data.mean/std) stay on the fast row-major path. a no-op copy-wise
+        # when vstack already produced C order
+        return np.ascontiguousarray(np.vstack(arrs))
+
+    padded = np.full(
+        (len(arrs), max(lengths)),
+        np.nan,
+        dtype=dtype_hint,  # None gives the float64 default
+        order="C",
+    )
+    for l, arr in enumerate(arrs):
+        padded[l, : len(arr)] = arr
+    return padded
+
+
 def _check_definition_contains_or(definition_dict, key, values):
     """need docstring"""
     out = False
@@ -782,13 +982,9 @@ def _summarize_data(data):
         defn = data[index]["definition"]
         for key in defn:
             try:
-                out[key].update(
-                    _remove_nans_from_set(set({value for value in defn[key]}))
-                )
+                out[key].update(_remove_nans_from_set(defn[key]))
             except KeyError:
-                out.update(
-                    {key: _remove_nans_from_set(set({value for value in defn[key]}))}
-                )
+                out.update({key: _remove_nans_from_set(defn[key])})
     return out
 
 
@@ -942,7 +1138,7 @@ class Data:
                         >>> Data.iloc[0]
 
         """
-        return iDataIndexer(self._dict.copy())
+        return iDataIndexer(self._dict)
 
     @property
     def summary(self):
@@ -952,7 +1148,7 @@ class Data:
                 (dict): summary of the data included
 
         """
-        return _summarize_data(self._dict.copy())
+        return _summarize_data(self._dict)
 
     @property
     def data_keys(self):
@@ -971,7 +1167,7 @@ class Data:
                 file (str): Path to file
         """
         with open(file, "wb") as f:
-            pickle.dump(self._dict, f)
+            pickle.dump(self._dict, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     def _get_indices_satisfying_definition_condtion(self, condition):
         """need docstring"""
@@ -1050,9 +1246,9 @@ class Data:
         if type(additional_data_keys_to_filter) == type(None):
             additional_data_keys_to_filter = []
         else:
-            additional_data_keys_to_filter = np.array(
-                [additional_data_keys_to_filter]
-            ).flatten()
+            additional_data_keys_to_filter = _as_iterable(
+                additional_data_keys_to_filter
+            )
 
         assert (
             len(data_condition_function_dict) <= 1
@@ -1154,20 +1350,36 @@ class Data:
         returns:
                 (Data): averaged data across 0th axis.
         """
-        tmp_out = {}
+        mean_data = {key: {} for key in self._dict}
+
+        # bucket indices whose data for a given key share a shape, so those
+        # stacks can be reduced with one numpy call instead of one per index
+        buckets = {}
         for key in self._dict:
-            tmp_out.update({key: self._dict[key].copy()})
             data = self._dict[key]["data"]
-            mean_data = {}
             for k in data:
                 if len(data[k].shape) == 1:  # 1d data
-                    mean_data.update({k: data[k]})
+                    mean_data[key].update({k: data[k]})
                 else:
-                    try:
-                        mean_data.update({k: np.mean(data[k], axis=0)})
-                    except AxisError:
-                        mean_data.update({k: data[k]})
-            tmp_out[key].update({"data": mean_data})
+                    buckets.setdefault((k, data[k].shape), []).append(key)
+
+        for (k, shape), keys in buckets.items():
+            try:
+                if len(keys) == 1:
+                    means = [np.mean(self._dict[keys[0]]["data"][k], axis=0)]
+                else:
+                    big = np.stack([self._dict[key]["data"][k] for key in keys])
+                    means = big.mean(axis=1)
+                for key, value in zip(keys, means):
+                    mean_data[key].update({k: value})
+            except (AxisError, TypeError):
+                for key in keys:
+                    mean_data[key].update({k: self._dict[key]["data"][k]})
+
+        tmp_out = {}
+        for key in self._dict:
+            tmp_out.update({key: self._dict[key].copy()})
+            tmp_out[key].update({"data": mean_data[key]})
         return Data(tmp_out)
 
     def std(self):
@@ -1408,12 +1620,12 @@ class Data:
                         1  2.75    0.0     1000.0        0.8
         """
 
-        include_defn_keys = np.array([include_defn_keys]).flatten()
+        include_defn_keys = _as_iterable(include_defn_keys)
 
         if defn_converter is None:
             float_converter = [lambda x: x for i in include_defn_keys]
         else:
-            float_converter = np.array([defn_converter]).flatten()
+            float_converter = _as_iterable(defn_converter)
             if len(float_converter) == 1:
                 float_converter = [float_converter[0] for key in include_defn_keys]
 
@@ -1515,7 +1727,7 @@ class Data:
             if type(y) == type(None):
                 pass
             else:
-                data_keys_to_plot = set(np.array([y]).flatten())
+                data_keys_to_plot = set(_as_iterable(y))
 
             for plotkey in data_keys_to_plot:
                 to_plot = self._dict[index]["data"][plotkey]
@@ -1527,25 +1739,24 @@ class Data:
                         ax.plot(xs, to_plot, color=color, label=label, **kwargs)
                     continue
 
-                for i in range(to_plot.shape[0]):
-                    if (
-                        i == 0
-                    ):  # label only the first becuase we don't want a big legend with many trials
-                        if x == None:
-                            ax.plot(to_plot[i, :], color=color, label=label, **kwargs)
-                        else:
-                            ax.plot(
-                                xs[i, :],
-                                to_plot[i, :],
-                                color=color,
-                                label=label,
-                                **kwargs
-                            )
-                    else:
-                        if x == None:
-                            ax.plot(to_plot[i, :], color=color, **kwargs)
-                        else:
-                            ax.plot(xs[i, :], to_plot[i, :], color=color, **kwargs)
+                # batch all traces of this group into a single LineCollection
+                # rather than one ax.plot (and one Artist) per trace. a single
+                # label per group keeps the legend from growing with trials
+                if x == None:
+                    trace_xs = [np.arange(to_plot.shape[1])] * to_plot.shape[0]
+                elif len(xs.shape) == 1:
+                    trace_xs = [xs] * to_plot.shape[0]
+                else:
+                    trace_xs = xs
+
+                segments = [
+                    np.column_stack((trace_x, trace))
+                    for trace_x, trace in zip(trace_xs, to_plot)
+                ]
+                ax.add_collection(
+                    LineCollection(segments, colors=color, label=label, **kwargs)
+                )
+                ax.autoscale_view()
 
         if labelby != None:
             ax.legend()
@@ -1616,7 +1827,7 @@ class Data:
             if type(y) == type(None):
                 pass
             else:
-                data_keys_to_plot = set(np.array([y]).flatten())
+                data_keys_to_plot = set(_as_iterable(y))
 
             for plotkey in data_keys_to_plot:
                 to_plot = self._dict[index]["data"][plotkey]
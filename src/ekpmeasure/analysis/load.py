@@ -10,6 +10,23 @@ from .core import Dataset, Data
 
 __all__ = ("load_Dataset", "generate_meta_data", "read_ekpds", "read_ekpdat")
 
+# cache of unpickled meta_data keyed by path. value is (st_mtime_ns, DataFrame)
+# so a rewritten meta_data file is picked up automatically. saves re-reading
+# the pickle when Datasets are rebuilt repeatedly during interactive analysis
+_META_CACHE = {}
+
+
+def _read_meta_data_pickle(path):
+    """Read ``path + 'meta_data'``, serving from ``_META_CACHE`` when the file is unchanged."""
+    st = os.stat(path + "meta_data")
+    cached = _META_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns:
+        return cached[1].copy()
+
+    meta_data = pd.read_pickle(path + "meta_data")
+    _META_CACHE[path] = (st.st_mtime_ns, meta_data)
+    return meta_data.copy()
+
 
 def load_Dataset(path, meta_data=None):
     """
@@ -66,6 +83,26 @@ def read_ekpds(filename):
             (Dataset): Dataset
 
     """
+    with open(filename, "rb") as f:
+        first = pickle.load(f)
+        if type(first) == dict:
+            # current layout: a single stream of three pickles (header dict,
+            # readfileby, meta_data) read sequentially with no scanning
+            readfileby = pickle.load(f)
+            meta_data = pickle.load(f)
+            return Dataset(
+                first["path"],
+                pd.DataFrame(meta_data),
+                readfileby,
+                pointercolumn=first["pointercolumn"],
+            )
+
+    # legacy layout: pickled preamble string followed by byte separators
+    return _read_legacy_ekpds(filename)
+
+
+def _read_legacy_ekpds(filename):
+    """Read a legacy `.ekpds` file (pickled preamble string + byte separators)."""
 
     with open(filename, "rb") as f:
         out = f.read()
@@ -109,7 +146,7 @@ def _build_df(path, meta_data):
     # I have noticed I'm getting an attribute error when the pickle file is created by a different version of pandas... TODO find the origin of this error, for now, updating to store meta_data as a csv as well in control.experiment
     if type(meta_data) == type(None):
         try:
-            return pd.read_pickle(path + "meta_data")
+            return _read_meta_data_pickle(path)
         except FileNotFoundError:
             try:
                 return pd.read_csv(path + "meta_data.csv")
@@ -142,7 +179,7 @@ def generate_meta_data(
 
     args:
             path (str): Specify the path to the directory
-            mapper ( function ) : filename (str) -> dict. A function which operates on a single file name in order to get the columns (dict key) and values (dict value) for meta_data of that file.
+            mapper ( function ) : filename (str) -> dict. A function which operates on a single file name in order to get the columns (dict key) and values (dict value) for meta_data of that file. If mapper has a ``.vectorized`` attribute, that is called once with the full directory listing and must return a ``pandas.DataFrame``.
             pointercolumn (str) : The name of the pointercolumn in the created meta_data
             overwrite (bool) : True will overwrite any existing meta_data in path.
 
@@ -173,23 +210,29 @@ def generate_meta_data(
             else:
                 print("overwriting.")
 
-    for file in os.listdir(path):
-        try:
-            if pass_path:
-                meta_data = pd.DataFrame(mapper(file, path=path), index=[0])
-            else:
-                meta_data = pd.DataFrame(mapper(file), index=[0])
-        except Exception as e:
-            print("unable to process file: {} \nError: {}".format(file, e))
-            continue
-        try:
-            existing_meta_data = pd.concat(
-                [existing_meta_data, meta_data], ignore_index=True
-            )
-        except NameError:
-            existing_meta_data = meta_data.copy()
+    vectorized = getattr(mapper, "vectorized", None)
+    if vectorized is not None and not pass_path:
+        # mapper provides a vectorized counterpart which parses the entire
+        # directory listing in one pass (see e.g. FE_switching.common_name_mapper_vec)
+        existing_meta_data = pd.DataFrame(vectorized(os.listdir(path)))
+    else:
+        # collect one dict per file and build the frame once at the end.
+        # appending to a DataFrame inside the loop copies all accumulated rows
+        # every iteration, which is quadratic in the number of files
+        rows = []
+        for file in os.listdir(path):
+            try:
+                if pass_path:
+                    rows.append(mapper(file, path=path))
+                else:
+                    rows.append(mapper(file))
+            except Exception as e:
+                print("unable to process file: {} \nError: {}".format(file, e))
+                continue
+
+        existing_meta_data = pd.DataFrame.from_records(rows)
 
-    if pointercolumn not in set(existing_meta_data.columns):
+    if pointercolumn not in existing_meta_data.columns:
         warnings.showwarning(
             'there is no map to key "{}" in mapping function "{}" provided\nEnsure self.pointercolumn property has been set appropriately or else you will be unable to retrieve data'.format(
                 pointercolumn, mapper.__name__
@@ -199,6 +242,7 @@ def generate_meta_data(
             0,
         )
 
-    existing_meta_data.to_pickle(path + "meta_data")
+    existing_meta_data.to_pickle(path + "meta_data", protocol=pickle.HIGHEST_PROTOCOL)
+    _META_CACHE.pop(path, None)
     print("meta_data saved to {}".format(path))
     return